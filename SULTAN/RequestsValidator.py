@@ -3,13 +3,16 @@
 import requests
 
 url = "INSERT URL TO USER PROFILE HERE"
+errortext = "INSERT ERROR TEXT HERE"
 r = requests.get(url)
-html = r.text
-notfound = (html.find("INSERT ERROR TEXT HERE"))
+html = r.text           # Decoded page, only used for reading
+
+# Checks the raw bytes for UTF-8 error text, the same way SULTAN.py does
+notfound = (r.content.find(errortext.encode("utf-8")))
             
 #If profile with username exists
 if notfound == -1:
-    print url           # Prints url to profile
+    print(url)          # Prints url to profile
 #If profile with username does not exist
 else:
-    print html          # Prints HTML to search for error code
+    print(html)         # Prints HTML to search for error code
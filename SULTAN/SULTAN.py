@@ -1,79 +1,128 @@
 # Imports needed to function
-import requests
+import asyncio
+import aiohttp
 import xlrd
 
+# Shared session used for every profile request, created by get_session()
+session = None
+
+# Returns the shared session, creating it on first use
+async def get_session():
+    global session
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, limit_per_host=10, enable_cleanup_closed=True),
+            timeout=aiohttp.ClientTimeout(total=30, connect=10))
+    return session
+
+# Reads a single page in chunks and checks it for the error text
+# Returns True if the error text was found, False if not, None if it could not connect
+async def fetch(url, errortext):
+    s = await get_session()
+    try:
+        async with s.get(url) as r:
+            tail = b""                  # End of the previous chunk, in case the error text is split across chunks
+            async for chunk in r.content.iter_chunked(65536):
+                data = tail + chunk
+                if errortext in data:
+                    return True         # Stops reading, the rest of the page is not needed
+                tail = data[max(0, len(data) - len(errortext) + 1):]
+            return False
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        print("Could not connect to: " + url)
+        return None
+
+# Checks every (url, error text) pair at once and returns the result of each, in the same order
+# (a pair listed more than once in the spreadsheet is only requested once)
+async def fetch_all(checks):
+    unique = list(dict.fromkeys(checks))
+    try:
+        results = await asyncio.gather(*[fetch(url, errortext) for url, errortext in unique],
+                                       return_exceptions=True)
+        # Any unexpected error on one site (a bug, not a connection problem) is shown and skipped
+        # instead of stopping the whole run
+        cache = {}
+        for check, result in zip(unique, results):
+            if isinstance(result, Exception):
+                print("Error checking " + check[0] + ": " + repr(result))
+                result = None
+            cache[check] = result
+        return [cache[check] for check in checks]
+    finally:
+        if session is not None:
+            await session.close()
+
 #Main function
 def main():
-	
-	#Arrays used to hold data imported from xlsx 
+
+    #Arrays used to hold data imported from xlsx
     urla = []
     urlb = []
     error = []
     valid = []
-    url = ""            # Holds full url (UrlA + username + UrlB)
+    checks = []         # Holds full url (UrlA + username + UrlB) and error text for each regular entry
     count = 0           # Counter for looping
+    page = 0            # Counter for the next checked page
     found = 0           # Counter for number of found usernames
     notfound = 0        # Flag for if error text found
-	
+
     #Prompt for username
-    username = raw_input("Enter a Username: ")
-    
+    username = input("Enter a Username: ")
+
     # Location of xlsx file for pulling data
     data = ("###REPLACEWITHFULLPATHTOYOURXLSXFILE###")
-    
+
     #Set up xlrd
     wb = xlrd.open_workbook(data)
     sheet = wb.sheet_by_index(0)
     sheet.cell_value(0,0)
-    
+
     # Pulls columns from excel file and adds them to array
-    for i in range(sheet.nrows): 
+    for i in range(sheet.nrows):
         urla.append((sheet.cell_value(i, 0)))
-        urlb.append((sheet.cell_value(i, 1)))  
+        urlb.append((sheet.cell_value(i, 1)))
         error.append((sheet.cell_value(i, 2)))
-        valid.append((sheet.cell_value(i, 3)))  
+        valid.append((sheet.cell_value(i, 3)))
 
-	
-	  #Loops through entire array
+    #Builds the full url for every regular entry (headers have none)
+    for n in urla:
+        if urla[count] != "header":
+
+            #To Validate valid usernames, comment out when not testing
+            #checks.append((str(urla[count]) + valid[count] + str(urlb[count]), error[count].encode("utf-8")))
+
+            #Assigns full weburl, uncomment when not testing
+            checks.append((str(urla[count]) + username + str(urlb[count]), error[count].encode("utf-8")))
+
+        count += 1                      # Increase counter
+
+    #Send requests to all pages at once
+    results = asyncio.run(fetch_all(checks))
+    count = 0
+
+    #Loops through entire array
     for n in urla:
-        
-        #To Validate valid usernames, comment out when not testing
-        #url = str(urla[count]) + valid[count] + str(urlb[count])   
-                            
-        #Assigns full weburl, uncomment when not testing
-        url = str(urla[count]) + username + str(urlb[count])
 
         # If line is a header
         if urla[count] == "header":
-            print ""                    # Spacing Line
-            print urlb[count]           # Prints Header
-            print ""                    # Spacing Line
-            
-            count += 1                  # Increase counter
-            
+            print("")                   # Spacing Line
+            print(urlb[count])          # Prints Header
+            print("")                   # Spacing Line
+
         # If line is not a header (regular entry)
         else:
+            url = checks[page][0]       # Full url of this entry
+            notfound = results[page]    # Whether the error text was found on this page
+            page += 1                   # Increases page counter
+
+            #If profile with username exists (skipped if could not connect)
+            if notfound is False:
+                print(url)              # Prints url to profile
+                found += 1              # Increases found count
+
+        count += 1                      # Increases counter
+
+    #Print the number of located profiles
+    print("\n\nSULTAN found: " + str(found) + " profiles for " + username + "!")
 
-            #Send request to page
-            try:
-                r = requests.get(url)
-            except:
-                print("Could not connect to: " + url)
-            
-            #returns the HTML as a string            
-            html = r.text
-
-            # read the data from the URL and check for error text
-            notfound = (html.find(error[count]))
-            
-            #If profile with username exists
-            if notfound == -1:
-                print url           # Prints url to profile
-                found += 1          # Increases found count
-	
-            count+=1                # Increases counter
-	
-	  #Print the number of located profiles
-    print "\n\nSULTAN found: " + str(found) + " profiles for " + username + "!"	
-	 
 main()